@@ -1,71 +1,286 @@
-from flask import Flask, request, render_template_string
-import requests
+import asyncio
+import atexit
+import functools
+import heapq
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, groupby, islice, zip_longest
+from urllib.parse import quote
+
+from flask import Flask, Response, request, stream_with_context
+import aiohttp
+from diskcache import Cache
 import pandas as pd
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
 app = Flask(__name__)
 
+# Background workers for scraping while the page is already streaming
+EXECUTOR = ThreadPoolExecutor(max_workers=16)
+
+# Splits the comma-separated skills field, absorbing surrounding whitespace
+SKILL_SPLIT = re.compile(r'\s*,\s*')
+
+# On-disk cache shared by every worker process on the host. It holds pickles
+# that are loaded on import, so it defaults to a directory the app owns
+# rather than a predictable path in a world-writable temp dir
+CACHE_DIR = os.environ.get('CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache'))
+CACHE = Cache(CACHE_DIR)
+
+JOB_LISTINGS_PATH = './job_listings.csv'
+
+# Bump when the loader or index format changes so cached copies are rebuilt
+JOB_DATA_VERSION = 1
+
 # Load job listings from CSV
 def load_job_listings():
     """Load job listings from a CSV file."""
-    df = pd.read_csv('./job_listings.csv')
+    df = pd.read_csv(JOB_LISTINGS_PATH)
+    # Company and Location repeat heavily, so store them as categoricals
+    for column in ('Company', 'Location'):
+        if column not in df:
+            df[column] = 'N/A'
+        df[column] = df[column].fillna('N/A').astype('category')
     return df
 
-# Internship scraping function with error handling
-def fetch_internships(skills, location=None):
-    """Fetch internships based on skills and location from Internshala with error handling."""
-    # Use the first skill as primary search term
-    primary_skill = skills[0] if skills else "internship"
-    query = primary_skill.replace(' ', '-').lower()
-    
-    url = f"https://internshala.com/internships/keywords-{query}"
+def build_skill_index(df):
+    """Map each lowercased required skill to the row positions that list it."""
+    index = {}
+    for i, required_skills in enumerate(df['Required_Skills'].fillna('')):
+        for skill in required_skills.lower().split(', '):
+            if skill.strip():
+                index.setdefault(skill.strip(), []).append(i)
+    return index
+
+def load_job_data():
+    """Return the job listings and skill index, cached until the CSV changes."""
+    stat = os.stat(JOB_LISTINGS_PATH)
+    # The pickled DataFrame is only readable by the pandas version that wrote it
+    key = ('job_data', JOB_DATA_VERSION, pd.__version__,
+           os.path.abspath(JOB_LISTINGS_PATH), stat.st_mtime_ns, stat.st_size)
+    try:
+        job_data = CACHE.get(key)
+    except Exception as e:
+        print(f"Error reading cached job listings: {e}")
+        job_data = None
+    if job_data is None:
+        df = load_job_listings()
+        job_data = (df, build_skill_index(df))
+        try:
+            CACHE.set(key, job_data)
+        except Exception as e:
+            print(f"Error caching job listings: {e}")
+    return job_data
+
+# Job listings are loaded once at startup and shared across requests
+JOB_LISTINGS_DF, SKILL_INDEX = load_job_data()
+
+# CSV columns shown for a job suggestion, mapped to the keys the template uses
+SUGGESTION_COLUMNS = {
+    'Job_Title': 'title',
+    'Company': 'company',
+    'Location': 'location',
+    'Required_Skills': 'skills',
+}
+
+# Cap on simultaneous outbound requests to Internshala
+MAX_CONCURRENT_FETCHES = 8
+
+# Only the first few skills get their own Internshala search
+MAX_SKILL_SEARCHES = 3
+
+# Parses pages off the scraping loop; kept apart from EXECUTOR, whose
+# workers block waiting on the loop
+PARSE_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+# One long-lived event loop owns the pooled HTTP session so keep-alive
+# connections to Internshala are reused across requests
+_scrape_loop = None
+_scrape_loop_lock = threading.Lock()
+_http_session = None
+
+# Upper bound on a single page fetch; a hung upstream otherwise holds a
+# worker thread and the streamed response open for aiohttp's 5 minute default
+FETCH_TIMEOUT = aiohttp.ClientTimeout(total=15)
+
+def get_scrape_loop():
+    """Return the background scraping event loop, starting it on first use."""
+    global _scrape_loop
+    with _scrape_loop_lock:
+        if _scrape_loop is None:
+            _scrape_loop = asyncio.new_event_loop()
+            threading.Thread(target=_scrape_loop.run_forever, name='scrape-loop', daemon=True).start()
+    return _scrape_loop
+
+def get_http_session():
+    """Return the shared HTTP session; must be called on the scraping loop."""
+    global _http_session
+    if _http_session is None:
+        connector = aiohttp.TCPConnector(limit=20, limit_per_host=10)
+        _http_session = aiohttp.ClientSession(connector=connector, timeout=FETCH_TIMEOUT)
+    return _http_session
+
+@atexit.register
+def close_http_session():
+    """Close the shared HTTP session and stop the scraping loop at exit."""
+    if _scrape_loop is None:
+        return
+    if _http_session is not None:
+        try:
+            asyncio.run_coroutine_threadsafe(_http_session.close(), _scrape_loop).result(timeout=5)
+        except Exception as e:
+            print(f"Error closing HTTP session: {e}")
+    _scrape_loop.call_soon_threadsafe(_scrape_loop.stop)
+
+# Scraped results are reused for ten minutes per set of search URLs
+INTERNSHIP_CACHE_TTL = 600
+
+def slugify(text):
+    """Lowercase text and join its words with hyphens, escaped for a URL path."""
+    return quote('-'.join(text.lower().split()), safe='')
+
+def build_internship_url(skill, location=None):
+    """Build the Internshala search URL for a skill and optional location."""
+    url = f"https://internshala.com/internships/keywords-{slugify(skill)}"
     if location and location.lower() != "any":
-        url += f"/location-{location.replace(' ', '-').lower()}"
-    
+        url += f"/location-{slugify(location)}"
+    return url
+
+# Listings live inside this container; everything before it is page chrome
+LISTINGS_MARKER = 'id="internship_list_container'
+
+def slice_listings(html):
+    """Drop the markup preceding the listings container, if it can be found."""
+    marker = html.find(LISTINGS_MARKER)
+    if marker == -1:
+        return html
+    return html[html.rfind('<', 0, marker):]
+
+# Internshala has no documented JSON API for keyword searches, so listings
+# are read from the results page HTML
+def parse_internships(html):
+    """Parse the top internship listings out of an Internshala results page."""
+    tree = LexborHTMLParser(slice_listings(html))
+    internships = []
+
+    for listing in tree.css('div.internship_meta'):
+        try:
+            title = listing.css_first('h3').text(strip=True)
+            # One pass over the anchors yields both the link and the company name
+            anchors = listing.css('a')
+            company_tag = next(
+                (a for a in anchors if 'link_display_like_text' in (a.attributes.get('class') or '').split()),
+                None,
+            )
+            company = company_tag.text(strip=True) if company_tag else "N/A"
+            link = "https://internshala.com" + anchors[0].attributes['href']
+            internships.append({'title': title, 'company': company, 'link': link})
+        except (AttributeError, IndexError, KeyError, TypeError) as e:
+            print(f"Error parsing internship listing: {e}")
+            continue
+        if len(internships) == 10:  # Limit to top 10 internships
+            break
+
+    return internships
+
+async def _fetch(session, semaphore, url):
+    """Fetch and parse a single Internshala results page."""
+    async with semaphore:
+        async with session.get(url) as response:
+            html = await response.text()
+    return await asyncio.get_running_loop().run_in_executor(PARSE_EXECUTOR, parse_internships, html)
+
+async def _fetch_all(urls):
+    """Fetch all result pages concurrently, returning exceptions in place of failures."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    session = get_http_session()
+    return await asyncio.gather(*[_fetch(session, semaphore, url) for url in urls], return_exceptions=True)
+
+def build_search_urls(skills, location=None):
+    """Return the distinct search URLs for a query, one per skill up to the search cap."""
+    # Fall back to a generic search term when no skills were given
+    urls = dict.fromkeys(build_internship_url(skill, location) for skill in skills or ["internship"])
+    return tuple(urls)[:MAX_SKILL_SEARCHES]
+
+def fetch_internships(skills, location=None):
+    """Fetch internships for a query, serving repeat queries from the shared cache."""
+    # Keyed by the URLs actually searched, so queries only share results they'd fetch anyway
+    urls = build_search_urls(skills, location)
+    key = ('internships',) + urls
     try:
-        response = requests.get(url)
-        soup = BeautifulSoup(response.content, 'html.parser')
-        internships = []
-        listings = soup.find_all('div', class_='internship_meta')
-
-        for listing in listings[:10]:  # Limit to top 10 internships
-            try:
-                title = listing.find('h3').get_text(strip=True)
-                company_tag = listing.find('a', class_='link_display_like_text')
-                company = company_tag.get_text(strip=True) if company_tag else "N/A"
-                link = "https://internshala.com" + listing.find('a')['href']
-                internships.append({'title': title, 'company': company, 'link': link})
-            except AttributeError as e:
-                print(f"Error parsing internship listing: {e}")
-                continue
-
-        return internships
+        internships = CACHE.get(key)
+    except Exception as e:
+        print(f"Error reading cached internships: {e}")
+        internships = None
+    if internships is None:
+        internships = scrape_internships(urls)
+        if internships is None:
+            # Every search failed; don't let a transient outage stick in the cache
+            return []
+        try:
+            CACHE.set(key, internships, expire=INTERNSHIP_CACHE_TTL)
+        except Exception as e:
+            print(f"Error caching internships: {e}")
+    return internships
 
+# Internship scraping function with error handling
+def scrape_internships(urls):
+    """Fetch and merge internships from Internshala search pages, or None if every fetch failed."""
+    # Search every URL concurrently
+    try:
+        results = asyncio.run_coroutine_threadsafe(_fetch_all(urls), get_scrape_loop()).result()
     except Exception as e:
         print(f"Error fetching internships: {e}")
-        return []
+        return None
+
+    batches = []
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"Error fetching internships: {result}")
+            continue
+        batches.append(result)
+    if not batches:
+        return None
+
+    # Interleave results across skills and drop listings returned by more than one search
+    internships = []
+    seen_links = set()
+    for internship in chain.from_iterable(zip_longest(*batches)):
+        if internship is None or internship['link'] in seen_links:
+            continue
+        seen_links.add(internship['link'])
+        internships.append(internship)
+
+    return internships[:10]  # Limit to top 10 internships
+
+class PendingResult:
+    """Wrap a future so the template only blocks on it once it tests or iterates it."""
+
+    def __init__(self, future):
+        self.future = future
+
+    def __bool__(self):
+        return bool(self.future.result())
+
+    def __iter__(self):
+        return iter(self.future.result())
+
+@functools.lru_cache(maxsize=512)
+def match_job_rows(skills_key):
+    """Return the positions of the first 10 jobs requiring any of the given skills."""
+    # Index lists are ascending, so merge them lazily and stop after 10 distinct rows
+    hit_rows = heapq.merge(*(SKILL_INDEX.get(skill, ()) for skill in skills_key))
+    return tuple(islice((row for row, _ in groupby(hit_rows)), 10))  # Limit to top 10 job suggestions
 
 def get_job_suggestions(skills, education_level=None, sector_interests=None):
     """Get job suggestions based on skills, education, and sector interests."""
-    job_listings = load_job_listings()
-    suggestions = []
-    
-    for _, row in job_listings.iterrows():
-        required_skills = [skill.strip().lower() for skill in row['Required_Skills'].split(', ')]
-        user_skills = [skill.strip().lower() for skill in skills]
-        
-        # Check if any user skills match required skills
-        skill_match = any(user_skill in required_skills for user_skill in user_skills)
-        
-        if skill_match:
-            suggestions.append({
-                'title': row['Job_Title'],
-                'company': row.get('Company', 'N/A'),
-                'location': row.get('Location', 'N/A'),
-                'skills': row['Required_Skills']
-            })
+    skills_key = tuple(sorted({skill.strip().lower() for skill in skills}))
+    matched = JOB_LISTINGS_DF.iloc[list(match_job_rows(skills_key))]
 
-    return suggestions[:10]  # Limit to top 10 job suggestions
+    result = matched.reindex(columns=list(SUGGESTION_COLUMNS)).fillna('N/A')
+    return result.rename(columns=SUGGESTION_COLUMNS).to_dict(orient='records')
 
 # Modern HTML template with attractive UI
 HTML_TEMPLATE = '''<!DOCTYPE html>
@@ -76,28 +291,8 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
     <title>Career Opportunity Finder</title>
     <link href="https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css" rel="stylesheet">
     <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
-    <style>
-        .gradient-bg {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        }
-        .card-hover {
-            transition: all 0.3s ease;
-        }
-        .card-hover:hover {
-            transform: translateY(-5px);
-            box-shadow: 0 20px 25px -5px rgba(0, 0, 0, 0.1), 0 10px 10px -5px rgba(0, 0, 0, 0.04);
-        }
-        .skill-tag {
-            background: linear-gradient(45deg, #4f46e5, #7c3aed);
-        }
-        .animate-fade-in {
-            animation: fadeIn 0.6s ease-in;
-        }
-        @keyframes fadeIn {
-            from { opacity: 0; transform: translateY(20px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-    </style>
+    <link href="{{ url_for('static', filename='app.css') }}" rel="stylesheet">
+    <script src="{{ url_for('static', filename='app.js') }}" defer></script>
 </head>
 <body class="gradient-bg min-h-screen">
     <div class="container mx-auto px-4 py-8">
@@ -205,40 +400,11 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
         </div>
 
         <!-- Results Section -->
-        {% if internships or job_suggestions %}
+        {% if job_suggestions or internships %}
         <div class="max-w-6xl mx-auto mt-12 animate-fade-in">
             <div class="grid grid-cols-1 lg:grid-cols-2 gap-8">
-                <!-- Internships -->
-                <div class="bg-white rounded-2xl shadow-2xl overflow-hidden">
-                    <div class="bg-gradient-to-r from-blue-500 to-cyan-500 p-6">
-                        <h2 class="text-2xl font-bold text-white text-center">
-                            <i class="fas fa-briefcase mr-2"></i>Internship Opportunities
-                        </h2>
-                    </div>
-                    <div class="p-6 space-y-4 max-h-96 overflow-y-auto">
-                        {% if internships %}
-                            {% for internship in internships %}
-                            <div class="card-hover bg-gradient-to-r from-blue-50 to-cyan-50 p-4 rounded-xl border border-blue-100">
-                                <h3 class="font-bold text-lg text-gray-800">{{ internship.title }}</h3>
-                                {% if internship.company != "N/A" %}
-                                    <p class="text-gray-600 mb-2">
-                                        <i class="fas fa-building mr-1"></i>{{ internship.company }}
-                                    </p>
-                                {% endif %}
-                                <a href="{{ internship.link }}" target="_blank" 
-                                   class="inline-flex items-center text-blue-600 hover:text-blue-800 font-medium">
-                                    <i class="fas fa-external-link-alt mr-1"></i>View Details
-                                </a>
-                            </div>
-                            {% endfor %}
-                        {% else %}
-                            <p class="text-gray-500 text-center py-8">No internships found. Try different skills or location.</p>
-                        {% endif %}
-                    </div>
-                </div>
-
-                <!-- Job Suggestions -->
-                <div class="bg-white rounded-2xl shadow-2xl overflow-hidden">
+                <!-- Job Suggestions (first in markup so they stream early; order-last keeps them on the right) -->
+                <div class="bg-white rounded-2xl shadow-2xl overflow-hidden order-last">
                     <div class="bg-gradient-to-r from-green-500 to-emerald-500 p-6">
                         <h2 class="text-2xl font-bold text-white text-center">
                             <i class="fas fa-star mr-2"></i>Job Suggestions
@@ -270,6 +436,35 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
                         {% endif %}
                     </div>
                 </div>
+
+                <!-- Internships -->
+                <div class="bg-white rounded-2xl shadow-2xl overflow-hidden">
+                    <div class="bg-gradient-to-r from-blue-500 to-cyan-500 p-6">
+                        <h2 class="text-2xl font-bold text-white text-center">
+                            <i class="fas fa-briefcase mr-2"></i>Internship Opportunities
+                        </h2>
+                    </div>
+                    <div class="p-6 space-y-4 max-h-96 overflow-y-auto">
+                        {% if internships %}
+                            {% for internship in internships %}
+                            <div class="card-hover bg-gradient-to-r from-blue-50 to-cyan-50 p-4 rounded-xl border border-blue-100">
+                                <h3 class="font-bold text-lg text-gray-800">{{ internship.title }}</h3>
+                                {% if internship.company != "N/A" %}
+                                    <p class="text-gray-600 mb-2">
+                                        <i class="fas fa-building mr-1"></i>{{ internship.company }}
+                                    </p>
+                                {% endif %}
+                                <a href="{{ internship.link }}" target="_blank" 
+                                   class="inline-flex items-center text-blue-600 hover:text-blue-800 font-medium">
+                                    <i class="fas fa-external-link-alt mr-1"></i>View Details
+                                </a>
+                            </div>
+                            {% endfor %}
+                        {% else %}
+                            <p class="text-gray-500 text-center py-8">No internships found. Try different skills or location.</p>
+                        {% endif %}
+                    </div>
+                </div>
             </div>
 
             <!-- Try Again Button -->
@@ -281,25 +476,12 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
         </div>
         {% endif %}
     </div>
-
-    <script>
-        // Add some interactive effects
-        document.addEventListener('DOMContentLoaded', function() {
-            // Animate form elements on focus
-            const inputs = document.querySelectorAll('input, select, textarea');
-            inputs.forEach(input => {
-                input.addEventListener('focus', function() {
-                    this.parentElement.classList.add('transform', 'scale-105');
-                });
-                input.addEventListener('blur', function() {
-                    this.parentElement.classList.remove('transform', 'scale-105');
-                });
-            });
-        });
-    </script>
 </body>
 </html>'''
 
+# Compiled once with the app's Jinja environment so requests only pay for rendering
+INDEX_TEMPLATE = app.jinja_env.from_string(HTML_TEMPLATE)
+
 @app.route('/', methods=['GET', 'POST'])
 def index():
     internships = []
@@ -313,16 +495,20 @@ def index():
         sectors = request.form.getlist('sectors')
         
         # Process skills (split by comma and clean)
-        skills = [skill.strip() for skill in skills_input.split(',') if skill.strip()]
+        skills = [skill for skill in SKILL_SPLIT.split(skills_input.strip()) if skill]
         
-        # Fetch internships based on skills and location
+        # Fetch internships in the background; the template waits on them last
         if skills:
-            internships = fetch_internships(skills, location)
+            internships = PendingResult(EXECUTOR.submit(fetch_internships, skills, location))
         
         # Get job suggestions based on skills, education, and sectors
         job_suggestions = get_job_suggestions(skills, education, sectors)
 
-    return render_template_string(HTML_TEMPLATE, internships=internships, job_suggestions=job_suggestions)
+    # Stream the page so the form and job suggestions arrive before scraping finishes
+    return Response(stream_with_context(
+        INDEX_TEMPLATE.generate(internships=internships, job_suggestions=job_suggestions)
+    ))
 
 if __name__ == '__main__':
-    app.run(debug=True)
+    # Development server only; production runs under gunicorn (see gunicorn.conf.py)
+    app.run()
@@ -0,0 +1,11 @@
+"""Gunicorn settings for serving the app in production."""
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+# Requests spend most of their time waiting on Internshala, so each worker
+# runs several threads alongside one process per CPU
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+worker_class = 'gthread'
+threads = 8
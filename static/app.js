@@ -0,0 +1,13 @@
+// Add some interactive effects
+document.addEventListener('DOMContentLoaded', function() {
+    // Animate form elements on focus
+    const inputs = document.querySelectorAll('input, select, textarea');
+    inputs.forEach(input => {
+        input.addEventListener('focus', function() {
+            this.parentElement.classList.add('transform', 'scale-105');
+        });
+        input.addEventListener('blur', function() {
+            this.parentElement.classList.remove('transform', 'scale-105');
+        });
+    });
+});